@@ -20,6 +20,17 @@ Import specific components directly from their modules:
     from gee_acolite.correction import ACOLITE
     from gee_acolite.bathymetry import multi_image
     from gee_acolite.water_quality import compute_water_bands, compute_water_mask, PRODUCTS
+    from gee_acolite.stats import zonal_stats, zonal_stats_arrays
+
+For batch runs over many images, initialise Earth Engine against the
+high-volume endpoint, which is tuned for scripted ``getInfo()`` traffic:
+
+    ee.Initialize(project='your-project-id',
+                  opt_url='https://earthengine-highvolume.googleapis.com')
+
+Corrected stacks carry many bands (rhot_*, rhos_*, water products); pass
+``tileScale=4`` (or higher) to ``reduceRegion`` over them to avoid
+"User memory limit exceeded" errors; ``zonal_stats`` does so by default.
 """
 
 __version__ = "0.1.0"
@@ -35,4 +46,7 @@ __all__ = [
     "compute_water_bands",
     "compute_water_mask",
     "PRODUCTS",
+    # Statistics
+    "zonal_stats",
+    "zonal_stats_arrays",
 ]
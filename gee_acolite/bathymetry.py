@@ -3,6 +3,8 @@ Bathymetry utilities for satellite-derived bathymetry (SDB) processing.
 """
 import ee
 
+from typing import List, Optional
+
 
 def optical_deep_water_model(
     model: ee.Image,
@@ -221,7 +223,12 @@ def apply_calibration(
     return psdb_image.multiply(slope).add(intercept).rename(output_name)
 
 
-def multi_image(images: ee.ImageCollection, band: str = 'pSDB_green') -> ee.Image:
+def multi_image(
+    images: ee.ImageCollection,
+    band: str = 'pSDB_green',
+    method: str = 'quality',
+    keep_bands: Optional[List[str]] = None
+) -> ee.Image:
     """
     Create a quality mosaic from multiple images based on a bathymetry band.
     
@@ -235,15 +242,45 @@ def multi_image(images: ee.ImageCollection, band: str = 'pSDB_green') -> ee.Imag
     band : str, optional
         Band name to use for quality assessment (default: 'pSDB_green').
         Pixels with higher values in this band are prioritized.
+    method : str, optional
+        Compositing method (default: 'quality').
+
+        - ``'quality'``: per-pixel ``qualityMosaic(band)``. Exact, but ranks
+          every pixel of every image on the quality band.
+        - ``'mosaic'``: images sorted by ``CLOUDY_PIXEL_PERCENTAGE`` so the
+          clearest scene ends up on top, then ``mosaic()``. Much cheaper,
+          since the first valid pixel in the stack wins, and a good
+          approximation when the clearest scene also has the best water
+          observations. ``band`` is not used by this method.
+    keep_bands : list of str, optional
+        Bands to carry into the mosaic besides ``band`` (default: None, keep
+        all bands). Corrected images hold dozens of bands; selecting only
+        those used downstream is the largest server-side saving.
     
     Returns
     -------
     ee.Image
         Quality mosaic image with the best pixels from the collection.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is not one of ``'quality'`` or ``'mosaic'``.
     
     Examples
     --------
     >>> images = ee.ImageCollection([image1, image2, image3])
     >>> mosaic = multi_image(images, band='pSDB_red')
+    >>> preview = multi_image(images, method='mosaic')
+    >>> sdb = multi_image(images, keep_bands=['rhos_B2', 'rhos_B3', 'rhos_B8'])
     """
-    return images.qualityMosaic(band)
\ No newline at end of file
+    if keep_bands is not None:
+        images = images.select(list(dict.fromkeys([band, *keep_bands])))
+
+    if method == 'quality':
+        return images.qualityMosaic(band)
+    elif method == 'mosaic':
+        # mosaic() paints the last image on top: sort cloudiest first
+        return images.sort('CLOUDY_PIXEL_PERCENTAGE', False).mosaic()
+    else:
+        raise ValueError(f"Unknown method '{method}'. Available methods: ['quality', 'mosaic']")
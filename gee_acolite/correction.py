@@ -6,20 +6,281 @@ Google Earth Engine workflows with Sentinel-2 imagery. It provides dark spectrum
 fitting for aerosol optical thickness (AOT) estimation and atmospheric correction.
 """
 import numpy as np
-import scipy.stats
 import ee
 import os
+import threading
 
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from types import ModuleType
-from functools import partial
+from functools import partial, lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 from gee_acolite.utils.l1_convert import l1_to_rrs
-from gee_acolite.utils.masks import mask_negative_reflectance
+from gee_acolite.utils.masks import mask_negative
 from gee_acolite.water_quality import compute_water_bands
 
 
+# ACOLITE reads NetCDF/HDF5 files (not thread-safe) and writes downloaded ancillary
+# data to a shared directory, so cached loaders run one at a time across threads
+_ACOLITE_IO_LOCK = threading.RLock()
+
+def _locked_cache(maxsize : int = 128):
+    """
+    ``lru_cache`` whose lookups and misses are serialised by ``_ACOLITE_IO_LOCK``.
+
+    Concurrent misses on the same key are not merged by ``lru_cache``; holding
+    the lock makes the first thread load the value and later threads reuse it.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached entries (default: 128).
+
+    Returns
+    -------
+    callable
+        Decorator for the cached loader.
+    """
+    def decorator(fn):
+        cached = lru_cache(maxsize=maxsize)(fn)
+
+        @wraps(fn)
+        def wrapper(*args):
+            with _ACOLITE_IO_LOCK:
+                return cached(*args)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+@_locked_cache(maxsize=256)
+def _import_luts(acolite: ModuleType, sensor: str) -> dict:
+    """
+    Load aerosol LUTs for a sensor, cached at module level.
+
+    LUT files are parsed once per (ACOLITE module, sensor) and shared by
+    every ``ACOLITE`` instance and every image of a collection.
+
+    Parameters
+    ----------
+    acolite : ModuleType
+        ACOLITE module imported from the ACOLITE package.
+    sensor : str
+        Sensor name (e.g., 'S2A_MSI').
+
+    Returns
+    -------
+    dict
+        Look-up table dictionary with atmospheric models.
+    """
+    return acolite.aerlut.import_luts(sensor=sensor)
+
+@_locked_cache(maxsize=256)
+def _rsr_dict(acolite: ModuleType, sensor: str) -> dict:
+    """
+    Load the relative spectral response of a sensor, cached at module level.
+
+    Parameters
+    ----------
+    acolite : ModuleType
+        ACOLITE module imported from the ACOLITE package.
+    sensor : str
+        Sensor name (e.g., 'S2A_MSI').
+
+    Returns
+    -------
+    dict
+        Relative spectral response dictionary for the sensor.
+    """
+    return acolite.shared.rsr_dict(sensor=sensor)[sensor]
+
+@_locked_cache(maxsize=256)
+def _import_rsky_luts(acolite: ModuleType, sensor: str) -> dict:
+    """
+    Load sky reflectance LUTs for a sensor, cached at module level.
+
+    Parameters
+    ----------
+    acolite : ModuleType
+        ACOLITE module imported from the ACOLITE package.
+    sensor : str
+        Sensor name (e.g., 'S2A_MSI').
+
+    Returns
+    -------
+    dict
+        Sky reflectance look-up tables used for glint correction.
+    """
+    return acolite.aerlut.import_rsky_luts(models=[1,2], 
+                                           lutbase='ACOLITE-RSKY-202102-82W', 
+                                           sensor=sensor)
+
+@_locked_cache(maxsize=256)
+def _gas_transmittance_cached(acolite: ModuleType, sensor: str, sza: float, vza: float, 
+                              pressure: float, uoz: float, uwv: float) -> dict:
+    """
+    Compute gas transmittance for a sensor, cached at module level.
+
+    Images of the same tile share nearly the same geometry, so callers round
+    the angles (see :func:`_gas_transmittance`) to reuse results across images.
+
+    Parameters
+    ----------
+    acolite : ModuleType
+        ACOLITE module imported from the ACOLITE package.
+    sensor : str
+        Sensor name (e.g., 'S2A_MSI').
+    sza : float
+        Solar zenith angle in degrees.
+    vza : float
+        View zenith angle in degrees.
+    pressure : float
+        Surface pressure in hPa.
+    uoz : float
+        Ozone column in cm-atm.
+    uwv : float
+        Water vapour column in g/cm².
+
+    Returns
+    -------
+    dict
+        Gas transmittance values per band.
+    """
+    return acolite.ac.gas_transmittance(sza, vza, 
+                                        pressure=pressure, 
+                                        uoz=uoz, 
+                                        uwv=uwv, 
+                                        rsr=_rsr_dict(acolite, sensor)['rsr'])
+
+def _gas_transmittance(acolite: ModuleType, sensor: str, sza: float, vza: float, 
+                       pressure: float, uoz: float, uwv: float) -> dict:
+    """
+    Compute gas transmittance, reusing results for near-identical geometry.
+
+    Angles are rounded to 2 decimals before the cached lookup; gas
+    transmittance varies smoothly with geometry so the error is negligible.
+
+    Parameters
+    ----------
+    acolite : ModuleType
+        ACOLITE module imported from the ACOLITE package.
+    sensor : str
+        Sensor name (e.g., 'S2A_MSI').
+    sza : float
+        Solar zenith angle in degrees.
+    vza : float
+        View zenith angle in degrees.
+    pressure : float
+        Surface pressure in hPa.
+    uoz : float
+        Ozone column in cm-atm.
+    uwv : float
+        Water vapour column in g/cm².
+
+    Returns
+    -------
+    dict
+        Gas transmittance values per band.
+    """
+    return _gas_transmittance_cached(acolite, sensor, round(float(sza), 2), round(float(vza), 2), 
+                                     float(pressure), float(uoz), float(uwv))
+
+def _atmospheric_parameters(lut : dict, bands : List[str], geometry : dict, aot : float) -> dict:
+    """
+    Interpolate every atmospheric parameter of a LUT for each band.
+
+    All parameters of a band are evaluated with a single interpolator call
+    on a stacked (n_parameters, 6) query.
+
+    Parameters
+    ----------
+    lut : dict
+        Single LUT model entry with 'ipd' (parameter indices) and 'rgi'
+        (interpolator per band).
+    bands : list of str
+        Band numbers to evaluate.
+    geometry : dict
+        Viewing geometry with keys 'raa', 'vza', 'sza', 'pressure'.
+    aot : float
+        Aerosol optical thickness at 550 nm.
+
+    Returns
+    -------
+    dict
+        Parameter values by parameter name and band (e.g., am['romix']['1']).
+    """
+    pars = list(lut['ipd'])
+    queries = np.tile([geometry['pressure'], 0.0, geometry['raa'], geometry['vza'], geometry['sza'], aot], (len(pars), 1))
+    queries[:, 1] = [lut['ipd'][par] for par in pars]
+
+    am = {par: {} for par in pars}
+    for b in bands:
+        values = lut['rgi'][b](queries)
+        for par, value in zip(pars, values):
+            am[par][b] = float(value)
+
+    return am
+
+def _interp_rows(x : np.ndarray, xp : np.ndarray, fp : np.ndarray) -> np.ndarray:
+    """
+    Row-wise ``np.interp`` for many curves sampled on a shared output grid.
+
+    Equivalent to ``[np.interp(x[i], xp[i], fp) for i in range(len(x))]``,
+    including clamping to ``fp[0]`` / ``fp[-1]`` outside the sampled range.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Value to interpolate per row, shape (n,).
+    xp : np.ndarray
+        Increasing sample positions per row, shape (n, m).
+    fp : np.ndarray
+        Sample values shared by all rows, shape (m,).
+
+    Returns
+    -------
+    np.ndarray
+        Interpolated values, shape (n,).
+    """
+    rows = np.arange(len(x))
+    upper = np.clip((xp < x[:, None]).sum(axis = 1), 1, xp.shape[1] - 1)
+    x0, x1 = xp[rows, upper - 1], xp[rows, upper]
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        values = fp[upper - 1] + (x - x0) * (fp[upper] - fp[upper - 1]) / (x1 - x0)
+
+    values = np.where(x <= xp[:, 0], fp[0], values)
+    return np.where(x >= xp[:, -1], fp[-1], values)
+
+@_locked_cache(maxsize=1024)
+def _ancillary(acolite: ModuleType, iso_date: str, lon: float, lat: float) -> dict:
+    """
+    Retrieve ancillary data for a date and location, cached at module level.
+
+    Parameters
+    ----------
+    acolite : ModuleType
+        ACOLITE module imported from the ACOLITE package.
+    iso_date : str
+        ISO formatted acquisition time (rounded to the hour by the caller).
+    lon : float
+        Longitude (rounded by the caller).
+    lat : float
+        Latitude (rounded by the caller).
+
+    Returns
+    -------
+    dict
+        Ancillary values (e.g., 'uoz', 'uwv', 'wind', 'pressure').
+    """
+    return acolite.ac.ancillary.get(iso_date, lon, lat)
+
+
 class ACOLITE(object):
     """
     ACOLITE atmospheric correction for Google Earth Engine.
@@ -70,7 +331,9 @@ class ACOLITE(object):
         # return self.acolite.acolite.settings.load(settings)
         return self.acolite.acolite.settings.parse('S2A_MSI', settings = settings)
     
-    def correct(self, images : ee.ImageCollection) -> Tuple[ee.ImageCollection, dict]:
+    def correct(self, images : ee.ImageCollection, 
+                settings_override : Optional[dict] = None,
+                max_images : Optional[int] = None) -> Tuple[ee.ImageCollection, dict]:
         """
         Apply atmospheric correction to image collection.
         
@@ -82,6 +345,14 @@ class ACOLITE(object):
         ----------
         images : ee.ImageCollection
             Collection of Sentinel-2 L1C images.
+        settings_override : dict, optional
+            Settings that replace the parsed ones for this run only. Lets a
+            single processor be reused across experiments instead of building
+            a new ``ACOLITE`` per settings variant.
+        max_images : int, optional
+            Upper bound on the number of images processed (default: None, all
+            images). The collection is limited server-side before it is
+            enumerated, so large searches never materialise in full.
         
         Returns
         -------
@@ -89,9 +360,21 @@ class ACOLITE(object):
             Atmospherically corrected images with surface reflectance bands.
         settings : dict
             Processing settings used for correction.
+
+        Examples
+        --------
+        >>> ac_gee = ACOLITE(ac, settings)
+        >>> darkest, _ = ac_gee.correct(images)
+        >>> percentile, _ = ac_gee.correct(images, settings_override={'dsf_spectrum_option': 'percentile'})
         """
-        images = l1_to_rrs(images, self.settings.get('s2_target_res', 10))
-        images, settings = self.l1_to_l2(images.toList(images.size()), images.size().getInfo(), self.settings)
+        settings = {**self.settings, **settings_override} if settings_override else self.settings
+
+        images = l1_to_rrs(images, settings.get('s2_target_res', 10))
+        if max_images is not None:
+            images = images.limit(max_images)
+
+        size = images.size().getInfo()
+        images, settings = self.l1_to_l2(images.toList(size), size, settings)
 
         return images, settings
     
@@ -103,6 +386,12 @@ class ACOLITE(object):
         Processes each image in the collection through atmospheric correction
         and optionally applies residual glint correction and water quality
         parameter computation.
+
+        Images are independent and their fitting is dominated by blocking
+        ``getInfo()`` round-trips, so with ``settings['n_workers'] > 1`` they
+        are fitted concurrently in a thread pool. Pair this with the Earth
+        Engine high-volume endpoint. LUT, RSR and ancillary loads are
+        serialised across workers and loaded once per key.
         
         Parameters
         ----------
@@ -123,19 +412,25 @@ class ACOLITE(object):
         corrected_images = []
 
         if settings['aerosol_correction'] == 'dark_spectrum':
-            for index in range(size):
-                rhos, bands, glint_params = self.dask_spectrum_fitting(ee.Image(images.get(index)), settings)
-        
-                if settings['dsf_residual_glint_correction'] and settings['dsf_residual_glint_correction_method'] == 'alternative':
-                    rhos = self.deglint_alternative(rhos, 
-                                                    bands, 
-                                                    glint_params,
-                                                    glint_max=float(settings.get('glint_mask_rhos_threshold', 0.05)))
+            # Credentials are process-wide, set them once rather than from every worker
+            if settings.get('ancillary_data', False):
+                self.prepare_earthdata_credentials(settings)
+
+            correct_image = partial(self.correct_image, settings=settings)
+            image_list = [ee.Image(images.get(index)) for index in range(size)]
+            n_workers = int(settings.get('n_workers', 1))
+
+            if n_workers > 1:
+                with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                    results = list(executor.map(correct_image, image_list))
+            else:
+                results = [correct_image(image) for image in image_list]
 
-                rhos = rhos.copyProperties(ee.Image(images.get(index)))
-                rhos = rhos.set('system:time_start', ee.Image(images.get(index)).get('system:time_start'))
+            corrected_images = [rhos for rhos, _ in results]
 
-                corrected_images.append(rhos)
+            # Keep the per-image values (ancillary data) of the last image
+            if results:
+                settings.update(results[-1][1])
             
         corrected_images = ee.ImageCollection.fromImages(corrected_images)
 
@@ -143,6 +438,42 @@ class ACOLITE(object):
             corrected_images = corrected_images.map(partial(compute_water_bands, settings=settings))
             
         return corrected_images, settings
+
+    def correct_image(self, image : ee.Image, settings : dict) -> Tuple[ee.Image, dict]:
+        """
+        Atmospherically correct a single L1 TOA reflectance image.
+
+        Runs dark spectrum fitting and the optional residual glint correction,
+        and carries the input image properties over to the result. Works on a
+        copy of ``settings`` so that images can be processed concurrently.
+
+        Parameters
+        ----------
+        image : ee.Image
+            Input image with TOA reflectance.
+        settings : dict
+            Processing settings.
+
+        Returns
+        -------
+        rhos : ee.Image
+            Surface reflectance image.
+        settings : dict
+            Copy of the settings with the per-image values used (e.g. ancillary data).
+        """
+        settings = dict(settings)
+        rhos, bands, glint_params = self.dask_spectrum_fitting(image, settings)
+
+        if settings['dsf_residual_glint_correction'] and settings['dsf_residual_glint_correction_method'] == 'alternative':
+            rhos = self.deglint_alternative(rhos, 
+                                            bands, 
+                                            glint_params,
+                                            glint_max=float(settings.get('glint_mask_rhos_threshold', 0.05)))
+
+        rhos = rhos.copyProperties(image)
+        rhos = rhos.set('system:time_start', image.get('system:time_start'))
+
+        return rhos, settings
     
     def dask_spectrum_fitting(self, image : ee.Image, settings : dict) -> Tuple[ee.Image, List[str], dict]:
         """
@@ -168,8 +499,11 @@ class ACOLITE(object):
         glint_ave : dict
             Glint correction parameters per band.
         """
+        # Scene metadata shared by ancillary data retrieval and LUT selection
+        meta = self.fetch_scene_metadata(image)
+
         if settings.get('ancillary_data', False):
-            settings = self.get_ancillary_data(image, settings)
+            settings = self.get_ancillary_data(image, settings, meta)
         else:
             for data, default in [(key, f'{key}_default') for key in ['uoz', 'uwv', 'wind', 'pressure']]:
                 settings[data] = settings.get(default)
@@ -181,11 +515,12 @@ class ACOLITE(object):
                 image, 
                 float(settings['dsf_fixed_aot']), 
                 settings['dsf_fixed_lut'], 
-                settings
+                settings,
+                meta
             )
         else:
             # Normal dark spectrum fitting workflow
-            am, glint_ave, bands = self.select_lut(image, settings)
+            am, glint_ave, bands = self.select_lut(image, settings, meta = meta)
         
         rhos = self.compute_rhos(image, am)
 
@@ -223,50 +558,38 @@ class ACOLITE(object):
         results : dict
             Dictionary with AOT estimation results per LUT model.
             Each entry contains: 'taua', 'taua_std', 'taua_cv', 'taua_bands',
-            'taua_arr', 'rhot_arr', 'bidx'.
+            'taua_arr', 'rhot_arr', 'bidx'. 'bidx' holds the indices of the
+            darkest bands only, sorted by increasing AOT.
         """
         results = {}
         nbands = settings['dsf_nbands']
+        # select_best_model uses up to dsf_nbands_fit (and at least two) darkest bands
+        n_darkest_max = max(nbands, settings.get('dsf_nbands_fit', 2), 2)
         
         raa = geometry['raa']
         vza = geometry['vza']
         sza = geometry['sza']
         pressure = geometry['pressure']
         
+        # Bands and gas corrected dark spectrum are the same for every LUT
+        taua_bands = [b for b in rsrd['rsr_bands'] if b not in aot_skip_bands]
+        rhot_arr = np.array([pdark['B{}'.format(b)] / ttg['tt_gas'][b] for b in taua_bands]).reshape(-1, 1)
+        
         for lut in lutd:
-            taua_arr = None
-            rhot_arr = None
-            taua_bands = []
-            
-            # Run through bands to estimate AOT
-            for b in rsrd['rsr_bands']:
-                if b in aot_skip_bands: 
-                    continue
+            tau = lutd[lut]['meta']['tau']
 
-                # Get path reflectance from LUT for this band
-                ret = lutd[lut]['rgi'][b]((pressure, lutd[lut]['ipd']['romix'], 
-                                          raa, vza, sza, lutd[lut]['meta']['tau']))
-
-                # Dark spectrum value for this band
-                rhot = np.asarray([pdark['B{}'.format(b)]])
-                
-                # Gas correction
-                rhot /= ttg['tt_gas'][b]
-                
-                # Interpolate AOT from observed rhot
-                taua = np.interp(rhot, ret, lutd[lut]['meta']['tau'])
-                
-                if taua_arr is None:
-                    rhot_arr = 1.0 * rhot
-                    taua_arr = 1.0 * taua
-                else:
-                    rhot_arr = np.vstack((rhot_arr, rhot))
-                    taua_arr = np.vstack((taua_arr, taua))
+            # One (ntau, 6) query array shared by the interpolators of every band
+            queries = np.tile([pressure, lutd[lut]['ipd']['romix'], raa, vza, sza, 0.0], (len(tau), 1))
+            queries[:, 5] = tau
 
-                taua_bands.append(b)
+            # Path reflectance from LUT for each band, interpolated to AOT from observed rhot
+            ret_arr = np.stack([lutd[lut]['rgi'][b](queries) for b in taua_bands])
+            taua_arr = _interp_rows(rhot_arr[:, 0], ret_arr, np.asarray(tau)).reshape(-1, 1)
 
-            # Aggregate AOT from darkest bands
-            bidx = np.argsort(taua_arr[:, 0])
+            # Aggregate AOT from darkest bands, only the first n_darkest need to be ordered
+            n_darkest = min(n_darkest_max, len(taua_bands))
+            bidx = np.argpartition(taua_arr[:, 0], n_darkest - 1)[:n_darkest]
+            bidx = bidx[np.argsort(taua_arr[bidx, 0])]
             taua = np.nanmean(taua_arr[bidx[0: nbands], 0])
             taua_std = np.nanstd(taua_arr[bidx[0: nbands], 0])
             taua_cv = taua_std / taua
@@ -327,23 +650,17 @@ class ACOLITE(object):
             # RMSD validation: compare predictions vs observations
             for lut in results:
                 fit_band_indices = results[lut]['bidx'][0:dsf_nbands_fit]
+                query = np.array([[pressure, lutd[lut]['ipd']['romix'], raa, vza, sza, results[lut]['taua']]])
                 
-                rmsd_values = []
-                for fit_idx in fit_band_indices:
-                    band = results[lut]['taua_bands'][fit_idx]
-                    
-                    # Observed rhot (gas corrected)
-                    rhot_obs = results[lut]['rhot_arr'][fit_idx, 0]
-                    
-                    # Modeled rhot using estimated AOT
-                    rhot_model = lutd[lut]['rgi'][band]((pressure, lutd[lut]['ipd']['romix'], 
-                                                         raa, vza, sza, results[lut]['taua']))
-                    
-                    # Squared difference
-                    rmsd_values.append((rhot_obs - rhot_model) ** 2)
+                # Observed rhot (gas corrected)
+                rhot_obs = results[lut]['rhot_arr'][fit_band_indices, 0]
+                
+                # Modeled rhot using estimated AOT
+                rhot_model = np.array([lutd[lut]['rgi'][results[lut]['taua_bands'][fit_idx]](query)
+                                       for fit_idx in fit_band_indices], dtype = np.float64).ravel()
                 
                 # Compute RMSD
-                results[lut]['rmsd'] = np.sqrt(np.mean(rmsd_values))
+                results[lut]['rmsd'] = np.sqrt(np.mean((rhot_obs - rhot_model) ** 2))
             
             sel_par = 'rmsd'
             
@@ -363,20 +680,17 @@ class ACOLITE(object):
             # Fallback: coefficient of variation
             sel_par = 'taua_cv'
         
-        # Select LUT with minimum selection parameter
-        sel_lut = None
-        sel_aot = None
-        sel_val = np.inf
+        # Select LUT with minimum selection parameter, ignoring non-finite values
+        candidates = [lut for lut in results if results[lut][sel_par] < np.inf]
+        if not candidates:
+            return None, None, sel_par, np.inf
 
-        for lut in results:
-            if results[lut][sel_par] < sel_val:
-                sel_val = results[lut][sel_par] * 1.0
-                sel_aot = results[lut]['taua'] * 1.0
-                sel_lut = '{}'.format(lut)
+        sel_lut = min(candidates, key = lambda lut: results[lut][sel_par])
         
-        return sel_lut, sel_aot, sel_par, sel_val
+        return sel_lut, results[sel_lut]['taua'], sel_par, results[sel_lut][sel_par]
     
-    def select_lut(self, image : ee.Image, settings : dict, aot_skip_bands : List[str] = ['9', '10', '11', '12']) -> Tuple[dict, dict, List[str]]:
+    def select_lut(self, image : ee.Image, settings : dict, aot_skip_bands : List[str] = ['9', '10', '11', '12'], 
+                   meta : Optional[dict] = None) -> Tuple[dict, dict, List[str]]:
         """
         Select optimal LUT and compute atmospheric correction parameters.
         
@@ -396,6 +710,8 @@ class ACOLITE(object):
             Processing settings.
         aot_skip_bands : list of str, optional
             Band numbers to skip in AOT estimation (default: ['9', '10', '11', '12']).
+        meta : dict, optional
+            Scene metadata from ``fetch_scene_metadata``. Fetched if not given.
         
         Returns
         -------
@@ -411,9 +727,8 @@ class ACOLITE(object):
         pdark = self.compute_pdark(image, settings)
 
         # Get geometry and atmospheric parameters
-        raa = image.get('raa').getInfo()
-        vza = image.get('vza').getInfo()
-        sza = image.get('sza').getInfo()
+        meta = meta if meta is not None else self.fetch_scene_metadata(image)
+        raa, vza, sza = meta['raa'], meta['vza'], meta['sza']
 
         geometry = {
             'raa': raa,
@@ -423,18 +738,15 @@ class ACOLITE(object):
         }
 
         # Get sensor and load LUTs
-        sensor = 'S2A_MSI' if 'S2A' in image.get('PRODUCT_ID').getInfo() else 'S2B_MSI'
-        
-        lutd = self.acolite.aerlut.import_luts(sensor=sensor)
-        rsrd = self.acolite.shared.rsr_dict(sensor=sensor)[sensor]
-        ttg = self.acolite.ac.gas_transmittance(sza, vza, 
-                                                pressure=settings['pressure'], 
-                                                uoz=settings['uoz'], 
-                                                uwv=settings['uwv'], 
-                                                rsr=rsrd['rsr'])
-        luti = self.acolite.aerlut.import_rsky_luts(models=[1,2], 
-                                                     lutbase='ACOLITE-RSKY-202102-82W', 
-                                                     sensor=sensor)
+        sensor = 'S2A_MSI' if 'S2A' in meta['pid'] else 'S2B_MSI'
+        
+        lutd = _import_luts(self.acolite, sensor)
+        rsrd = _rsr_dict(self.acolite, sensor)
+        ttg = _gas_transmittance(self.acolite, sensor, sza, vza, 
+                                 pressure=settings['pressure'], 
+                                 uoz=settings['uoz'], 
+                                 uwv=settings['uwv'])
+        luti = _import_rsky_luts(self.acolite, sensor)
 
         # Step 1: Estimate AOT for each LUT model
         results = self.estimate_aot_per_lut(pdark, lutd, rsrd, ttg, geometry, 
@@ -449,12 +761,7 @@ class ACOLITE(object):
         print(f'  Pressure: {geometry["pressure"]:.2f} hPa')
 
         # Step 3: Compute atmospheric correction parameters for selected model
-        am = {}
-        for par in lutd[sel_lut]['ipd']:
-            am[par] = {b: lutd[sel_lut]['rgi'][b]((geometry['pressure'], 
-                                                   lutd[sel_lut]['ipd'][par], 
-                                                   raa, vza, sza, sel_aot))
-                        for b in rsrd['rsr_bands']}
+        am = _atmospheric_parameters(lutd[sel_lut], rsrd['rsr_bands'], geometry, sel_aot)
         am.update({'tg': ttg['tt_gas']})
 
         # Step 4: Compute glint correction parameters
@@ -462,16 +769,16 @@ class ACOLITE(object):
         glint_wind = 20
         glint_bands = ['11', '12']
 
-        glint_dict = {b: luti[model]['rgi'][b]((raa, vza, sza, glint_wind, sel_aot)) 
-                     for b in rsrd['rsr_bands']}
-        glint_ave = {b: glint_dict[b] / ((glint_dict[glint_bands[0]] + 
-                                         glint_dict[glint_bands[1]]) / 2) 
-                    for b in glint_dict}
+        # Glint reflectance per band, normalised by the mean of the glint bands
+        bands = rsrd['rsr_bands']
+        glint_values = np.array([luti[model]['rgi'][b]((raa, vza, sza, glint_wind, sel_aot)) for b in bands])
+        glint_norm = (glint_values[bands.index(glint_bands[0])] + glint_values[bands.index(glint_bands[1])]) / 2
+        glint_ave = dict(zip(bands, glint_values / glint_norm))
 
         return am, glint_ave, rsrd['rsr_bands']
     
     def compute_correction_with_fixed_aot(self, image: ee.Image, aot: float, lut_name: str, 
-                                         settings: dict) -> Tuple[dict, dict, List[str]]:
+                                         settings: dict, meta: Optional[dict] = None) -> Tuple[dict, dict, List[str]]:
         """
         Compute atmospheric correction parameters using fixed AOT and LUT.
         
@@ -489,6 +796,8 @@ class ACOLITE(object):
             LUT name (e.g., 'ACOLITE-LUT-202110-MOD2').
         settings : dict
             Processing settings including pressure, ozone, water vapor.
+        meta : dict, optional
+            Scene metadata from ``fetch_scene_metadata``. Fetched if not given.
         
         Returns
         -------
@@ -506,9 +815,8 @@ class ACOLITE(object):
             If specified LUT name is not found in available LUTs.
         """
         # Extract geometry from image
-        raa = image.get('raa').getInfo()
-        vza = image.get('vza').getInfo()
-        sza = image.get('sza').getInfo()
+        meta = meta if meta is not None else self.fetch_scene_metadata(image)
+        raa, vza, sza = meta['raa'], meta['vza'], meta['sza']
         
         geometry = {
             'raa': raa,
@@ -518,10 +826,10 @@ class ACOLITE(object):
         }
         
         # Get sensor
-        sensor = 'S2A_MSI' if 'S2A' in image.get('PRODUCT_ID').getInfo() else 'S2B_MSI'
+        sensor = 'S2A_MSI' if 'S2A' in meta['pid'] else 'S2B_MSI'
         
         # Load specified LUT
-        lutd = self.acolite.aerlut.import_luts(sensor=sensor)
+        lutd = _import_luts(self.acolite, sensor)
         
         # Verify LUT exists
         if lut_name not in lutd:
@@ -529,34 +837,26 @@ class ACOLITE(object):
             raise ValueError(f"LUT '{lut_name}' not found. Available LUTs: {available_luts}")
         
         # Get RSR data
-        rsrd = self.acolite.shared.rsr_dict(sensor=sensor)[sensor]
+        rsrd = _rsr_dict(self.acolite, sensor)
         pressure = settings['pressure']
         uoz = settings['uoz']
         uwv = settings['uwv']
 
         # Compute gas transmittance
-        ttg = self.acolite.ac.gas_transmittance(sza, vza, 
-                                                pressure=pressure, 
-                                                uoz=uoz, 
-                                                uwv=uwv, 
-                                                rsr=rsrd['rsr'])
+        ttg = _gas_transmittance(self.acolite, sensor, sza, vza, 
+                                 pressure=pressure, 
+                                 uoz=uoz, 
+                                 uwv=uwv)
         
         # Load sky glint LUTs
-        luti = self.acolite.aerlut.import_rsky_luts(models=[1,2], 
-                                                     lutbase='ACOLITE-RSKY-202102-82W', 
-                                                     sensor=sensor)
+        luti = _import_rsky_luts(self.acolite, sensor)
         
         print(f'Using fixed AOT={aot:.3f} with LUT={lut_name}')
         print(f'  Geometry: SZA={geometry["sza"]:.2f}°, VZA={geometry["vza"]:.2f}°, RAA={geometry["raa"]:.2f}°')
         print(f'  Pressure: {geometry["pressure"]:.2f} hPa')
         
         # Compute atmospheric correction parameters for specified LUT and AOT
-        am = {}
-        for par in lutd[lut_name]['ipd']:
-            am[par] = {b: lutd[lut_name]['rgi'][b]((geometry['pressure'], 
-                                                     lutd[lut_name]['ipd'][par], 
-                                                     raa, vza, sza, aot))
-                        for b in rsrd['rsr_bands']}
+        am = _atmospheric_parameters(lutd[lut_name], rsrd['rsr_bands'], geometry, aot)
         am.update({'tg': ttg['tt_gas']})
         
         # Compute glint correction parameters
@@ -564,11 +864,11 @@ class ACOLITE(object):
         glint_wind = 20
         glint_bands = ['11', '12']
         
-        glint_dict = {b: luti[model]['rgi'][b]((raa, vza, sza, glint_wind, aot)) 
-                     for b in rsrd['rsr_bands']}
-        glint_ave = {b: glint_dict[b] / ((glint_dict[glint_bands[0]] + 
-                                         glint_dict[glint_bands[1]]) / 2) 
-                    for b in glint_dict}
+        # Glint reflectance per band, normalised by the mean of the glint bands
+        bands = rsrd['rsr_bands']
+        glint_values = np.array([luti[model]['rgi'][b]((raa, vza, sza, glint_wind, aot)) for b in bands])
+        glint_norm = (glint_values[bands.index(glint_bands[0])] + glint_values[bands.index(glint_bands[1])]) / 2
+        glint_ave = dict(zip(bands, glint_values / glint_norm))
         
         return am, glint_ave, rsrd['rsr_bands']
     
@@ -594,42 +894,66 @@ class ACOLITE(object):
             Dictionary with dark spectrum values per band (e.g., {'B1': 0.05, ...}).
         """
         obands_rhot = ['B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A', 'B9', 'B10', 'B11', 'B12']
+        dsf_spectrum_option = settings.get('dsf_spectrum_option', 'darkest')
 
-        image_to_reduce = image.updateMask(image.gt(0))
+        image_to_reduce = image.updateMask(image.gt(0)).select(obands_rhot)
 
         pdark_by_band = {}
-        indexes = np.arange(settings['dsf_intercept_pixels'])
 
-        for band in obands_rhot:
-            if settings.get('dsf_spectrum_option', 'darkest') == 'darkest':
-                band_data = image_to_reduce.select(band).reduceRegion(reducer = ee.Reducer.percentile([0]), 
-                                                        bestEffort = True, scale = 10, maxPixels = 1e8)
-                
-                if band_data:
-                    pdark_by_band[band] = band_data.getInfo()[band]
-                else:
-                    pdark_by_band[band] = 0.0
+        # All bands are reduced together and fetched with a single getInfo()
+        if dsf_spectrum_option in ('darkest', 'percentile'):
+            percentile = 0 if dsf_spectrum_option == 'darkest' else settings['dsf_percentile']
+            band_data = image_to_reduce.reduceRegion(reducer = ee.Reducer.percentile([percentile]), 
+                                                     bestEffort = True, scale = 10, maxPixels = 1e8).getInfo()
 
-            elif settings.get('dsf_spectrum_option', 'darkest') == 'percentile':
-                band_data = image_to_reduce.select(band).reduceRegion(reducer = ee.Reducer.percentile([settings['dsf_percentile']]), 
-                                                        bestEffort = True, scale = 10, maxPixels = 1e8)
-                
-                if band_data:
-                    pdark_by_band[band] = band_data.getInfo()[band]
-                else:
-                    pdark_by_band[band] = 0.0
-            elif settings.get('dsf_spectrum_option', 'darkest') == 'intercept':
-                data = image_to_reduce.select(band).reduceRegion(reducer = ee.Reducer.toList(), scale = 30, bestEffort = True, maxPixels = 1e8)
-                band_data = data.get(band)
-
-                if band_data:
-                    values = ee.List(band_data).sort().slice(0, settings['dsf_intercept_pixels']).getInfo()
-                    slope, intercept, r, p, se = scipy.stats.linregress(indexes, values)
-                    pdark_by_band[band] = intercept
+            for band in obands_rhot:
+                value = band_data.get(band)
+                pdark_by_band[band] = 0.0 if value is None else value
+
+        elif dsf_spectrum_option == 'intercept':
+            data = image_to_reduce.reduceRegion(reducer = ee.Reducer.toList(), scale = 30, bestEffort = True, maxPixels = 1e8)
+            n_pixels = settings['dsf_intercept_pixels']
+            band_data = data.map(lambda band, values: ee.List(values).sort().slice(0, n_pixels)).getInfo()
+
+            for band in obands_rhot:
+                values = band_data.get(band)
+
+                if values:
+                    pdark_by_band[band] = self._rank_intercept(np.asarray(values, dtype = np.float64))
                 else:
                     pdark_by_band[band] = 0.0
 
         return pdark_by_band
+
+    @staticmethod
+    def _rank_intercept(values : np.ndarray) -> float:
+        """
+        Intercept of a least-squares line fitted to sorted values against their rank.
+
+        Closed form of ``scipy.stats.linregress(np.arange(n), values).intercept``,
+        using the known mean ``(n - 1) / 2`` and sum of squares ``n (n² - 1) / 12``
+        of the ranks.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Sorted pixel values.
+
+        Returns
+        -------
+        float
+            Value of the fitted line at rank 0.
+        """
+        n = values.size
+        if n < 2:
+            return float(values[0])
+
+        xm = (n - 1) / 2
+        ym = values.mean()
+        sxx = n * (n ** 2 - 1) / 12
+        slope = np.dot(np.arange(n) - xm, values - ym) / sxx
+
+        return float(ym - slope * xm)
     
     def compute_rhos(self, image : ee.Image, am : dict) -> ee.Image:
         """
@@ -654,31 +978,40 @@ class ACOLITE(object):
             Image with both TOA reflectance (rhot_*) and surface reflectance
             (rhos_*) bands.
         """
-        l2r_rrs = ee.Image().select([])
-
         romix = am['romix']
         dutott = am['dutott']
         astot = am['astot']
         tgas = am['tg']
 
-        for band in romix:
-            band_name = 'B' + band
-            rhot_noatm = ee.Image().expression('(data / tg) - ppath', {'data' : image.select(band_name), 'tg' : tgas[band], 'ppath' : float(romix[band])}).rename(band_name)
-            rhos = ee.Image().expression('(data) / (tdu + sa * data)', {'data' : rhot_noatm.select(band_name), 'tdu' : float(dutott[band]), 'sa' : float(astot[band])}).rename(band_name)
-            rhos = mask_negative_reflectance(rhos, band_name)
-            l2r_rrs = l2r_rrs.addBands(image.select(band_name).rename(f'rhot_{band_name}').toFloat())
-            l2r_rrs = l2r_rrs.addBands(rhos.rename(f'rhos_{band_name}').toFloat())
+        # All bands are corrected at once with per-band constant images
+        band_names = ['B' + band for band in romix]
+
+        def constants(values : dict) -> ee.Image:
+            return ee.Image.constant([float(values[band]) for band in romix])
+
+        toa = image.select(band_names)
+        rhot_noatm = toa.divide(constants(tgas)).subtract(constants(romix))
+        rhos = rhot_noatm.divide(constants(dutott).add(constants(astot).multiply(rhot_noatm)))
+        rhos = mask_negative(rhos)
+
+        rhot_names = [f'rhot_{band_name}' for band_name in band_names]
+        rhos_names = [f'rhos_{band_name}' for band_name in band_names]
+        l2r_rrs = toa.rename(rhot_names).toFloat().addBands(rhos.rename(rhos_names).toFloat())
+
+        # Keep the interleaved rhot/rhos band order
+        l2r_rrs = l2r_rrs.select([name for pair in zip(rhot_names, rhos_names) for name in pair])
 
         return l2r_rrs
 
 
-    def get_ancillary_data(self, image: ee.Image, settings : dict) -> dict:
+    def get_ancillary_data(self, image: ee.Image, settings : dict, meta : Optional[dict] = None) -> dict:
         """
         Retrieve ancillary atmospheric data from NASA Earthdata.
         
         Fetches ozone, water vapor, wind speed, and surface pressure data
         from NASA GMAO or NCEP reanalysis products for the image location
-        and acquisition time.
+        and acquisition time. Earthdata credentials must already be set with
+        ``prepare_earthdata_credentials`` (done once per collection by ``l1_to_l2``).
         
         Parameters
         ----------
@@ -686,16 +1019,23 @@ class ACOLITE(object):
             Input image with geometry and timestamp.
         settings : dict
             Processing settings including Earthdata credentials and default values.
+        meta : dict, optional
+            Scene metadata from ``fetch_scene_metadata``. Fetched if not given.
         
         Returns
         -------
         settings : dict
             Updated settings with ancillary data values.
         """
-        settings = self.prepare_earthdata_credentials(settings)
-        iso_date, lon, lat = self.prepare_query(image)
+        iso_date, lon, lat = self.prepare_query(image, meta)
 
-        anc = self.acolite.ac.ancillary.get(iso_date, lon, lat)
+        # Scenes whose time rounds to the same hour and whose centroid rounds to the same
+        # 0.1° share one request. The rounded time is also what ACOLITE is queried with, so
+        # the interpolated values may differ from an exact-time query (time shifted by up
+        # to 30 minutes, position by up to 0.05°)
+        acquired = datetime.strptime(iso_date, '%Y-%m-%d %H:%M:%S')
+        hour = (acquired + timedelta(minutes=30)).replace(minute=0, second=0)
+        anc = _ancillary(self.acolite, hour.strftime('%Y-%m-%d %H:%M:%S'), round(lon, 1), round(lat, 1))
 
         for data, default in [('uoz', 'uoz_default'), ('uwv', 'uwv_default'), 
                             ('wind', 'wind_default'), ('pressure', 'pressure_default')]:
@@ -703,7 +1043,7 @@ class ACOLITE(object):
         
         return settings
 
-    def prepare_query(self, image: ee.Image):
+    def prepare_query(self, image: ee.Image, meta : Optional[dict] = None):
         """
         Extract location and timestamp from image for ancillary data query.
         
@@ -711,6 +1051,8 @@ class ACOLITE(object):
         ----------
         image : ee.Image
             Input image with geometry and timestamp metadata.
+        meta : dict, optional
+            Scene metadata from ``fetch_scene_metadata``. Fetched if not given.
         
         Returns
         -------
@@ -721,12 +1063,37 @@ class ACOLITE(object):
         lat : float
             Latitude of image centroid.
         """
-        coords = image.geometry().centroid().coordinates().getInfo()
-        iso_date = ee.Date(image.get('system:time_start')).format('YYYY-MM-dd HH:mm:ss').getInfo()
+        meta = meta if meta is not None else self.fetch_scene_metadata(image)
 
-        lon, lat = coords
+        iso_date = meta['date']
+        lon, lat = meta['coords']
         return iso_date,lon,lat
 
+    def fetch_scene_metadata(self, image: ee.Image) -> dict:
+        """
+        Fetch the scalar image metadata used during correction in one round-trip.
+        
+        Parameters
+        ----------
+        image : ee.Image
+            Input image with geometry and timestamp metadata.
+        
+        Returns
+        -------
+        meta : dict
+            Plain dictionary with keys 'raa', 'vza', 'sza' (degrees), 'pid'
+            (PRODUCT_ID), 'date' (ISO formatted acquisition time) and 'coords'
+            ([lon, lat] of the image centroid).
+        """
+        return ee.Dictionary({
+            'raa': image.get('raa'),
+            'vza': image.get('vza'),
+            'sza': image.get('sza'),
+            'pid': image.get('PRODUCT_ID'),
+            'date': ee.Date(image.get('system:time_start')).format('YYYY-MM-dd HH:mm:ss'),
+            'coords': image.geometry().centroid().coordinates(),
+        }).getInfo()
+
     def prepare_earthdata_credentials(self, settings: dict) -> dict:
         """
         Set NASA Earthdata credentials as environment variables.
@@ -805,14 +1172,13 @@ class ACOLITE(object):
         # Only apply correction where observed glint is below threshold and positive
         glint_mask = gc_ref_mean.gt(glint_min).And(gc_ref_mean.lt(glint_max))
         
-        # Step 4: Apply band-specific glint correction
-        for band in bands:
-            band_name = 'rhos_B' + band
-            
-            # Skip if modeled surface reflectance is invalid
-            if np.isinf(glint_ave[band]) or np.isnan(glint_ave[band]):
-                continue
-            
+        # Step 4: Apply band-specific glint correction to all bands at once
+        # Skip bands whose modeled surface reflectance is invalid
+        valid_bands = [band for band in bands if np.isfinite(glint_ave[band])]
+
+        if valid_bands:
+            band_names = ['rhos_B' + band for band in valid_bands]
+
             # Compute current band glint (cur_rhog in ACOLITE):
             # cur_rhog = gc_ref_mean * (surf_current_band / gc_sur_mean)
             # 
@@ -821,19 +1187,19 @@ class ACOLITE(object):
             # - Average modeled surface reflectance of reference bands (gc_sur_mean)
             #
             # The ratio accounts for spectral variation in surface reflectance
-            glint_ratio = glint_ave[band] / gc_sur_mean
-            cur_rhog = gc_ref_mean.multiply(glint_ratio).rename('cur_rhog')
+            glint_ratio = ee.Image.constant([float(glint_ave[band] / gc_sur_mean) for band in valid_bands])
+            cur_rhog = glint_ratio.multiply(gc_ref_mean)
             
             # Mask the glint correction to valid pixels
             cur_rhog = cur_rhog.updateMask(glint_mask)
             
             # Apply glint correction: rhos_corrected = rhos_original - glint
-            rhos_corrected = image.select(band_name).subtract(cur_rhog)
+            rhos_corrected = image.select(band_names).subtract(cur_rhog)
             
-            # Mask negative values (can occur in dark pixels or over-correction)
-            rhos_corrected = mask_negative_reflectance(rhos_corrected, band_name)
+            # Mask negative values per band (can occur in dark pixels or over-correction)
+            rhos_corrected = mask_negative(rhos_corrected)
             
-            # Replace the band in the output image (overwrite=True)
+            # Replace the bands in the output image (overwrite=True)
             deglinted = deglinted.addBands(rhos_corrected, overwrite=True)
         
         # Optional: Write glint mean for visualization/validation
@@ -0,0 +1,100 @@
+"""
+Zonal statistics over atmospherically corrected image collections.
+
+Provides batched, server-side region reducers for water quality products
+so that statistics for every product and image are computed in a single
+deferred request.
+"""
+import ee
+
+from typing import List
+
+
+def zonal_stats(images : ee.ImageCollection, roi : ee.Geometry, params : List[str],
+                scale : int = 100, tile_scale : int = 4,
+                best_effort : bool = True) -> ee.ImageCollection:
+    """
+    Compute mean and standard deviation of bands over a region for each image.
+
+    All requested bands are reduced together with one combined
+    ``mean`` + ``stdDev`` reducer per image, and the results are stored as
+    image properties named ``{band}_mean`` and ``{band}_stdDev``.
+
+    Parameters
+    ----------
+    images : ee.ImageCollection
+        Corrected image collection (e.g., output of ``ACOLITE.correct``).
+    roi : ee.Geometry
+        Region over which statistics are computed.
+    params : list of str
+        Band names to reduce (e.g., ['SPM_Nechad2016_665', 'chl_oc3']).
+    scale : int, optional
+        Reduction scale in metres (default: 100).
+    tile_scale : int, optional
+        ``tileScale`` passed to ``reduceRegion`` (default: 4). Higher
+        values lower per-worker memory on heavy, many-band stacks.
+    best_effort : bool, optional
+        Use a coarser scale if the region holds too many pixels (default: True).
+
+    Returns
+    -------
+    ee.ImageCollection
+        Input collection with ``{band}_mean`` and ``{band}_stdDev`` properties.
+
+    Examples
+    --------
+    >>> with_stats = zonal_stats(corrected, roi, ['SPM_Nechad2016_665', 'chl_oc3'])
+    >>> with_stats.aggregate_array('chl_oc3_mean').getInfo()
+    """
+    reducer = ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs = True)
+
+    def add_stats(image : ee.Image) -> ee.Image:
+        stats = image.select(params).reduceRegion(reducer = reducer, geometry = roi, scale = scale,
+                                                  bestEffort = best_effort, maxPixels = 1e9,
+                                                  tileScale = tile_scale)
+        return image.set(stats)
+
+    return images.map(add_stats)
+
+def zonal_stats_arrays(images : ee.ImageCollection, roi : ee.Geometry, params : List[str],
+                       scale : int = 100, tile_scale : int = 4,
+                       best_effort : bool = True) -> ee.Dictionary:
+    """
+    Compute region statistics for a collection as aligned per-image arrays.
+
+    Runs :func:`zonal_stats` and gathers the acquisition times and every
+    statistic into one ``ee.Dictionary``, so a whole time series is
+    retrieved with a single ``getInfo()``.
+
+    Parameters
+    ----------
+    images : ee.ImageCollection
+        Corrected image collection.
+    roi : ee.Geometry
+        Region over which statistics are computed.
+    params : list of str
+        Band names to reduce.
+    scale : int, optional
+        Reduction scale in metres (default: 100).
+    tile_scale : int, optional
+        ``tileScale`` passed to ``reduceRegion`` (default: 4).
+    best_effort : bool, optional
+        Use a coarser scale if the region holds too many pixels (default: True).
+
+    Returns
+    -------
+    ee.Dictionary
+        Keys ``'system:time_start'``, ``'{band}_mean'`` and ``'{band}_stdDev'``,
+        each mapped to a list with one value per image. Images without valid
+        pixels in ``roi`` are dropped so that all lists stay aligned.
+
+    Examples
+    --------
+    >>> series = zonal_stats_arrays(corrected, roi, ['SPM_Nechad2016_665']).getInfo()
+    >>> series['SPM_Nechad2016_665_mean']
+    """
+    keys = [f'{param}_{stat}' for param in params for stat in ('mean', 'stdDev')]
+    with_stats = zonal_stats(images, roi, params, scale, tile_scale, best_effort)
+    with_stats = with_stats.filter(ee.Filter.notNull(keys))
+
+    return ee.Dictionary({key : with_stats.aggregate_array(key) for key in ['system:time_start', *keys]})
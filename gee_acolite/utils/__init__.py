@@ -5,7 +5,9 @@ Utility functions for GEE ACOLITE processing
 from gee_acolite.utils.l1_convert import l1_to_rrs, DN_to_rrs, resample
 from gee_acolite.utils.masks import (
     mask_negative_reflectance,
+    mask_negative,
     toa_mask,
+    toa_mask_combined,
     cirrus_mask,
     non_water,
     add_cloud_bands,
@@ -15,6 +17,7 @@ from gee_acolite.utils.masks import (
 )
 from gee_acolite.utils.search import (
     search,
+    search_batch,
     search_list,
     search_with_cloud_proba,
     join_s2_with_cloud_prob,
@@ -27,7 +30,9 @@ __all__ = [
     "resample",
     # Masks
     "mask_negative_reflectance",
+    "mask_negative",
     "toa_mask",
+    "toa_mask_combined",
     "cirrus_mask",
     "non_water",
     "add_cloud_bands",
@@ -36,6 +41,7 @@ __all__ = [
     "cld_shdw_mask",
     # Search
     "search",
+    "search_batch",
     "search_list",
     "search_with_cloud_proba",
     "join_s2_with_cloud_prob",
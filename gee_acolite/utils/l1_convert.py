@@ -5,7 +5,6 @@ Provides functions to convert Sentinel-2 L1C Digital Numbers to
 top-of-atmosphere (TOA) reflectance with proper geometric metadata.
 """
 import ee
-from functools import partial
 
 from gee_acolite.sensors.sentinel2 import SENTINEL2_BANDS, BAND_BY_SCALE
 
@@ -29,8 +28,8 @@ def l1_to_rrs(images : ee.ImageCollection, scale: int) -> ee.ImageCollection:
     ee.ImageCollection
         Collection with TOA reflectance and geometry metadata.
     """
-    resample_scale = partial(resample, band = BAND_BY_SCALE.get(scale, 'B2'))
-    return images.select(SENTINEL2_BANDS).map(DN_to_rrs).map(resample_scale)
+    reference_band = BAND_BY_SCALE.get(scale, 'B2')
+    return images.select(SENTINEL2_BANDS).map(lambda image: resample(DN_to_rrs(image), reference_band))
 
 def DN_to_rrs(image : ee.Image) -> ee.Image:
     """
@@ -51,23 +50,20 @@ def DN_to_rrs(image : ee.Image) -> ee.Image:
         Image with TOA reflectance (0-1) and geometry properties:
         'sza', 'saa', 'vza', 'vaa', 'raa'.
     """
-    rrs = image.divide(10_000)
-
-    rrs = rrs.set('sza', image.get('MEAN_SOLAR_ZENITH_ANGLE'))
-    rrs = rrs.set('saa', image.get('MEAN_SOLAR_AZIMUTH_ANGLE'))
-    rrs = rrs.set('vza', get_mean_band_angle(image, 'ZENITH'))
-    rrs = rrs.set('vaa', get_mean_band_angle(image, 'AZIMUTH'))
-
-    raa = ee.Number(rrs.get('saa')).subtract(rrs.get('vaa')).abs()
+    rrs = ee.Image(image.divide(10_000).copyProperties(image))
+    rrs = rrs.set('system:time_start', image.get('system:time_start'))
 
+    vaa = get_mean_band_angle(image, 'AZIMUTH')
+    raa = ee.Number(image.get('MEAN_SOLAR_AZIMUTH_ANGLE')).subtract(vaa).abs()
     raa = ee.Algorithms.If(raa.gt(180), raa.subtract(360).abs(), raa)
-    rrs = rrs.set('raa', raa)
-    rrs = rrs.set('PRODUCT_ID', ee.String(ee.String(image.get('PRODUCT_ID')).split('L1C').get(0)))
-
-    rrs = rrs.set('system:time_start', image.get('system:time_start'))
 
-    rrs = rrs.copyProperties(image)
-    rrs = rrs.set('system:time_start', image.get('system:time_start'))
+    rrs = rrs.set({
+        'sza': image.get('MEAN_SOLAR_ZENITH_ANGLE'),
+        'saa': image.get('MEAN_SOLAR_AZIMUTH_ANGLE'),
+        'vza': get_mean_band_angle(image, 'ZENITH'),
+        'vaa': vaa,
+        'raa': raa,
+    })
 
     return rrs
 
@@ -91,18 +87,10 @@ def get_mean_band_angle(image : ee.Image, angle_name : str) -> ee.Number:
     ee.Number
         Mean viewing angle across all bands (in degrees).
     """
-    bands = image.bandNames()
-    
-    for index in range(13):
-       bands = bands.set(index, ee.String('MEAN_INCIDENCE_' + angle_name + '_ANGLE_').cat(bands.get(index)))
-    
-    angle = ee.Number(0)
-    for index in range(13):
-       angle = angle.add(ee.Number(image.get(bands.get(index))))
-    else:
-        angle = angle.divide(image.bandNames().length())
+    prefix = ee.String('MEAN_INCIDENCE_' + angle_name + '_ANGLE_')
+    angles = image.bandNames().map(lambda band: ee.Number(image.get(prefix.cat(band))))
     
-    return angle
+    return ee.Number(angles.reduce(ee.Reducer.mean()))
 
 def resample(image : ee.Image, band: str) -> ee.Image:
     """
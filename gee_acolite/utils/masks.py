@@ -6,6 +6,8 @@ water/land classification, and quality filtering.
 """
 import ee
 
+from typing import List
+
 
 def mask_negative_reflectance(image : ee.Image, band : str) -> ee.Image:
     """
@@ -28,6 +30,25 @@ def mask_negative_reflectance(image : ee.Image, band : str) -> ee.Image:
     """
     return image.updateMask(image.select(band).gte(0)).rename(band)
 
+def mask_negative(image : ee.Image) -> ee.Image:
+    """
+    Mask out negative reflectance values in every band.
+    
+    Multi-band counterpart of ``mask_negative_reflectance``: each band is
+    masked independently and band names are kept.
+    
+    Parameters
+    ----------
+    image : ee.Image
+        Image with one or more reflectance bands.
+    
+    Returns
+    -------
+    ee.Image
+        Masked image with only non-negative values.
+    """
+    return image.updateMask(image.gte(0))
+
 def toa_mask(image : ee.Image, band : str = 'rhot_B11', threshold : float = 0.03):
     """
     Create mask based on TOA reflectance threshold.
@@ -51,6 +72,30 @@ def toa_mask(image : ee.Image, band : str = 'rhot_B11', threshold : float = 0.03
     """
     return image.select(band).lt(threshold)
 
+def toa_mask_combined(image : ee.Image, bands : List[str], threshold : float = 0.03) -> ee.Image:
+    """
+    Create a single TOA reflectance threshold mask over several bands.
+    
+    Equivalent to chaining ``toa_mask`` for every band with ``updateMask``:
+    a pixel is valid only if all bands are below the threshold, and pixels
+    where any band is masked are invalid.
+    
+    Parameters
+    ----------
+    image : ee.Image
+        Image with TOA reflectance bands.
+    bands : list of str
+        Band names to check (e.g., ['rhot_B1', ..., 'rhot_B12']).
+    threshold : float, optional
+        Maximum reflectance threshold (default: 0.03).
+    
+    Returns
+    -------
+    ee.Image
+        Binary mask (1 = valid, 0 = masked).
+    """
+    return image.select(bands).lt(threshold).unmask(0).reduce(ee.Reducer.min()).rename('toa_mask')
+
 def cirrus_mask(image : ee.Image, band : str = 'rhot_B10', threshold : float = 0.005):
     """
     Create cirrus cloud mask.
@@ -7,10 +7,47 @@ the GEE catalog, with optional cloud probability data integration.
 import ee
 
 from typing import Optional
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _collection(name : str) -> ee.ImageCollection:
+    """
+    Return a catalog ImageCollection handle, built once per asset id.
+    
+    Parameters
+    ----------
+    name : str
+        Asset id (e.g., 'COPERNICUS/S2_HARMONIZED').
+    
+    Returns
+    -------
+    ee.ImageCollection
+        Unfiltered collection; filters return new collections so the handle is never modified.
+    """
+    return ee.ImageCollection(name)
+
+
+def _tile_filter(tile : str) -> ee.Filter:
+    """
+    Build an exact-match filter on the ``MGRS_TILE`` property.
+    
+    Parameters
+    ----------
+    tile : str
+        Tile identifier, with or without the leading 'T' (e.g., 'T30SYJ' or '30SYJ').
+    
+    Returns
+    -------
+    ee.Filter
+        Equality filter on ``MGRS_TILE``, which stores the tile without the 'T'.
+    """
+    return ee.Filter.eq('MGRS_TILE', tile[1:] if tile.startswith('T') else tile)
 
 
 def search(roi : ee.Geometry, start : str, end : str, 
-           collection : str = 'S2_HARMONIZED', tile : Optional[str] = None) -> ee.ImageCollection:
+           collection : str = 'S2_HARMONIZED', tile : Optional[str] = None,
+           require_full_coverage : bool = False, max_cloud : Optional[float] = None) -> ee.ImageCollection:
     """
     Search for Sentinel-2 images in a region and time period.
     
@@ -26,17 +63,70 @@ def search(roi : ee.Geometry, start : str, end : str,
         Sentinel-2 collection name (default: 'S2_HARMONIZED').
         Options: 'S2_HARMONIZED', 'S2', 'S2_SR', 'S2_SR_HARMONIZED'.
     tile : str, optional
-        Specific tile identifier to filter (e.g., 'T30SYJ').
+        Specific tile identifier to filter (e.g., 'T30SYJ' or '30SYJ').
+    require_full_coverage : bool, optional
+        Keep only images whose footprint fully contains ``roi`` (default: False).
+        Falls back to all intersecting images if none fully covers it.
+    max_cloud : float, optional
+        Maximum scene ``CLOUDY_PIXEL_PERCENTAGE`` (0-100). Cloudier scenes
+        are dropped before any band is read.
     
     Returns
     -------
     ee.ImageCollection
         Collection of matching Sentinel-2 images.
     """
-    if tile is None:
-        sentinel2_l1 = ee.ImageCollection(f'COPERNICUS/{collection}').filterBounds(roi).filterDate(start, end)
-    else:
-        sentinel2_l1 = ee.ImageCollection(f'COPERNICUS/{collection}').filterBounds(roi).filterDate(start, end).filter(ee.Filter.stringContains('PRODUCT_ID', tile))
+    sentinel2_l1 = _collection(f'COPERNICUS/{collection}').filterBounds(roi).filterDate(start, end)
+
+    if tile is not None:
+        sentinel2_l1 = sentinel2_l1.filter(_tile_filter(tile))
+
+    if max_cloud is not None:
+        sentinel2_l1 = sentinel2_l1.filter(ee.Filter.lte('CLOUDY_PIXEL_PERCENTAGE', max_cloud))
+
+    if require_full_coverage:
+        covering = sentinel2_l1.filter(ee.Filter.contains(leftField = '.geo', rightValue = roi))
+        sentinel2_l1 = ee.ImageCollection(ee.Algorithms.If(covering.limit(1).size().gt(0), covering, sentinel2_l1))
+
+    return sentinel2_l1
+
+def search_batch(rois : list[ee.Geometry], start : str, end : str, 
+                 collection : str = 'S2_HARMONIZED', tile : Optional[str] = None,
+                 max_cloud : Optional[float] = None) -> ee.ImageCollection:
+    """
+    Search for Sentinel-2 images intersecting any of several regions.
+    
+    All regions are combined into one ``ee.FeatureCollection`` and used in
+    a single ``filterBounds``, so the catalog is scanned once and a scene
+    covering several regions is returned only once.
+    
+    Parameters
+    ----------
+    rois : list of ee.Geometry
+        Regions of interest (e.g., the tiles of a mosaic).
+    start : str
+        Start date in format 'YYYY-MM-DD'.
+    end : str
+        End date in format 'YYYY-MM-DD'.
+    collection : str, optional
+        Sentinel-2 collection name (default: 'S2_HARMONIZED').
+    tile : str, optional
+        Specific tile identifier to filter.
+    max_cloud : float, optional
+        Maximum scene ``CLOUDY_PIXEL_PERCENTAGE`` (0-100).
+    
+    Returns
+    -------
+    ee.ImageCollection
+        Collection of Sentinel-2 images intersecting at least one region.
+    """
+    regions = ee.FeatureCollection([ee.Feature(roi) for roi in rois])
+    sentinel2_l1 = _collection(f'COPERNICUS/{collection}').filterBounds(regions).filterDate(start, end)
+
+    if tile is not None:
+        sentinel2_l1 = sentinel2_l1.filter(_tile_filter(tile))
+    if max_cloud is not None:
+        sentinel2_l1 = sentinel2_l1.filter(ee.Filter.lte('CLOUDY_PIXEL_PERCENTAGE', max_cloud))
 
     return sentinel2_l1
 
@@ -66,11 +156,18 @@ def search_list(roi : ee.Geometry, starts : list[str], ends : list[str],
     ee.ImageCollection
         Collection with first image from each date range.
     """
-    return ee.ImageCollection.fromImages([search(roi, start, end, collection, tile).first() for start, end in zip(starts, ends)])
+    # Filter the catalog once over the whole period, then pick the first image per range server-side
+    images = search(roi, min(starts), max(ends), collection, tile)
+    ranges = ee.List([ee.List([start, end]) for start, end in zip(starts, ends)])
+
+    return ee.ImageCollection(ranges.map(lambda dates: images.filterDate(ee.List(dates).get(0), ee.List(dates).get(1)).first()))
 
 
 def search_with_cloud_proba(roi : ee.Geometry, start : str, end : str, 
-                            collection : str = 'S2_HARMONIZED', tile : Optional[str] = None) -> ee.ImageCollection:
+                            collection : str = 'S2_HARMONIZED', tile : Optional[str] = None,
+                            max_cloud : Optional[float] = None, 
+                            max_cloud_proba : Optional[float] = None,
+                            enabled : bool = True) -> ee.ImageCollection:
     """
     Search Sentinel-2 images and join with Cloud Probability data.
     
@@ -89,41 +186,77 @@ def search_with_cloud_proba(roi : ee.Geometry, start : str, end : str,
         Sentinel-2 collection name (default: 'S2_HARMONIZED').
     tile : str, optional
         Specific tile identifier to filter.
+    max_cloud : float, optional
+        Maximum scene ``CLOUDY_PIXEL_PERCENTAGE`` (0-100).
+    max_cloud_proba : float, optional
+        Maximum mean cloud probability (0-100) inside ``roi``. The mean is
+        stored as the 'roi_cloud_probability' property; images without a
+        cloud probability image are dropped when this is set.
+    enabled : bool, optional
+        Join the cloud probability data (default: True). Pass
+        ``settings.get('s2_cloud_proba', False)`` so the join is skipped when
+        the cloud probability mask is not used; the plain :func:`search`
+        result is then returned and ``max_cloud_proba`` is ignored.
     
     Returns
     -------
     ee.ImageCollection
         Collection with Cloud Probability data joined.
     """
-    s2_collection = search(roi, start, end, collection, tile)
-    return join_s2_with_cloud_prob(s2_collection)
+    s2_collection = search(roi, start, end, collection, tile, max_cloud = max_cloud)
+
+    if not enabled:
+        return s2_collection
+
+    s2_collection = join_s2_with_cloud_prob(s2_collection, roi, start, end)
 
+    if max_cloud_proba is not None:
+        def add_roi_cloud_probability(image):
+            probability = ee.Image(image.get('cloud_prob')).reduceRegion(reducer = ee.Reducer.mean(), geometry = roi, 
+                                                                         scale = 60, bestEffort = True, maxPixels = 1e9)
+            return image.set('roi_cloud_probability', probability.get('probability'))
 
-def join_s2_with_cloud_prob(s2_collection : ee.ImageCollection) -> ee.ImageCollection:
+        s2_collection = s2_collection.filter(ee.Filter.notNull(['cloud_prob'])) \
+            .map(add_roi_cloud_probability) \
+            .filter(ee.Filter.lte('roi_cloud_probability', max_cloud_proba))
+
+    return s2_collection
+
+
+def join_s2_with_cloud_prob(s2_collection : ee.ImageCollection, roi : Optional[ee.Geometry] = None, 
+                            start : Optional[str] = None, end : Optional[str] = None) -> ee.ImageCollection:
     """
     Join Sentinel-2 collection with Cloud Probability data.
     
     Matches each Sentinel-2 image with its corresponding cloud probability
     image from the COPERNICUS/S2_CLOUD_PROBABILITY collection using the
-    system:index property.
+    system:index property. The match is done with a single server-side
+    join; images without a cloud probability image are kept.
     
     Parameters
     ----------
     s2_collection : ee.ImageCollection
         Sentinel-2 L1C image collection.
+    roi : ee.Geometry, optional
+        Region used to pre-filter the cloud probability collection.
+    start : str, optional
+        Start date in format 'YYYY-MM-DD' used to pre-filter the cloud probability collection.
+    end : str, optional
+        End date in format 'YYYY-MM-DD' used to pre-filter the cloud probability collection.
         
     Returns
     -------
     ee.ImageCollection
         Collection with Cloud Probability images added as 'cloud_prob' property.
     """
+    cloud_prob = _collection('COPERNICUS/S2_CLOUD_PROBABILITY')
+
+    if roi is not None:
+        cloud_prob = cloud_prob.filterBounds(roi)
+    if start is not None and end is not None:
+        cloud_prob = cloud_prob.filterDate(start, end)
+
+    join = ee.Join.saveFirst(matchKey = 'cloud_prob', outer = True)
+    condition = ee.Filter.equals(leftField = 'system:index', rightField = 'system:index')
     
-    def add_cloud_prob(img):
-        img_index = img.get('system:index')
-        cloud = ee.ImageCollection('COPERNICUS/S2_CLOUD_PROBABILITY') \
-            .filter(ee.Filter.equals('system:index', img_index)) \
-            .first()
-        
-        return img.set('cloud_prob', cloud)
-    
-    return s2_collection.map(add_cloud_prob)
\ No newline at end of file
+    return ee.ImageCollection(join.apply(s2_collection, cloud_prob, condition))
@@ -16,6 +16,11 @@ import gee_acolite.utils.masks as masks
 from gee_acolite.sensors.sentinel2 import SENTINEL2_BANDS
 
 
+_PI = float(np.pi)
+_LN10 = float(np.log(10))
+_LOG_1000_PI = float(np.log(1_000 * np.pi))
+
+
 def compute_water_mask(image: ee.Image, settings: dict) -> ee.Image:
     """
     Create a comprehensive water mask for quality control.
@@ -43,10 +48,9 @@ def compute_water_mask(image: ee.Image, settings: dict) -> ee.Image:
     mask = mask.updateMask(masks.cirrus_mask(image, 
                                              threshold = settings.get('l2w_mask_cirrus_threshold', 0.005)))
     
-    for band in SENTINEL2_BANDS:
-        mask = mask.updateMask( masks.toa_mask(image, 
-                                                f'rhot_{band}', 
-                                                settings.get('l2w_mask_high_toa_threshold', 0.3)) )
+    mask = mask.updateMask(masks.toa_mask_combined(image, 
+                                                   [f'rhot_{band}' for band in SENTINEL2_BANDS], 
+                                                   settings.get('l2w_mask_high_toa_threshold', 0.3)))
         
     if settings.get('s2_cloud_proba', False):
         CLOUD_PROB_THRESHOLD = int(settings.get('s2_cloud_proba__cloud_threshold', 50))
@@ -66,40 +70,91 @@ def compute_water_bands(image: ee.Image, settings: dict) -> ee.Image:
     Compute water quality parameters and add them as bands.
     
     Applies water mask and computes selected water quality parameters
-    based on settings configuration.
+    based on settings configuration. All products are masked together and
+    added to the image in a single ``addBands``.
     
     Parameters
     ----------
     image : ee.Image
         Atmospherically corrected image with surface reflectance bands.
     settings : dict
-        Processing settings including 'l2w_parameters' list.
+        Processing settings including 'l2w_parameters' list. Duplicate
+        entries are ignored.
     
     Returns
     -------
     ee.Image
-        Input image with added water quality parameter bands.
+        Input image with added water quality parameter bands, or the input
+        image unchanged when no parameters are requested.
     """
+    # Repeated product names are computed once; nothing requested, nothing to mask
+    params = list(dict.fromkeys(settings.get('l2w_parameters') or []))
+    if not params:
+        return image
+
     mask = compute_water_mask(image, settings)
     median_radius = int(settings.get('psdb_median_radius', 1))
+    nechad_products = [product for product in params if product in NECHAD2016]
+    psdb_products = [product for product in params if product in PSDB_BANDS]
+
+    # Products only read reflectance bands; masking them keeps focal filters (pSDB) on water pixels
+    working = image.select('rhos_.*').updateMask(mask)
+    new_bands = []
 
-    for product in settings['l2w_parameters']:
+    for product in params:
         fn = PRODUCTS[product]
-        if product in ('pSDB_green', 'pSDB_red'):
-            new_band = fn(image, median_radius=median_radius)
+        if product in NECHAD2016:
+            # All requested Nechad products are computed together at the first one
+            if product != nechad_products[0]:
+                continue
+            new_band = nechad2016(working, nechad_products)
+        elif product in PSDB_BANDS:
+            # Both pSDB ratios share the smoothed, log-transformed blue band
+            if product != psdb_products[0]:
+                continue
+            new_band = psdb(working, psdb_products, median_radius=median_radius)
         else:
-            new_band = fn(image)
+            new_band = fn(working)
 
-        if isinstance(new_band, list):
-            new_band = [band.updateMask(mask) for band in new_band]
-        else:
-            new_band = new_band.updateMask(mask)
+        new_bands.append(new_band)
+
+        # Rrs bands are inputs of later products (pSDB, NDWI)
+        if product == 'Rrs_*':
+            working = working.addBands(new_band)
 
-        image = image.addBands(new_band)
+    if new_bands:
+        # Re-mask the outputs too: focal filters (pSDB) fill masked pixels from their neighbours
+        image = image.addBands(ee.Image.cat(new_bands).updateMask(mask))
 
     return image
 
 
+def nechad2016(image : ee.Image, products : list) -> ee.Image:
+    """
+    Compute several Nechad et al. (2016) SPM / turbidity products at once.
+    
+    All products share the form ``(A * rhos) / (1 - (rhos / C))``, so they
+    are evaluated as one multi-band operation with per-band constants.
+    
+    Parameters
+    ----------
+    image : ee.Image
+        Image with surface reflectance bands 'rhos_B4', 'rhos_B5', 'rhos_B6'.
+    products : list of str
+        Product keys from ``NECHAD2016`` (e.g., ['spm_nechad2016', 'tur_nechad2016']).
+    
+    Returns
+    -------
+    ee.Image
+        One band per product, with the same names as the single-product functions.
+    """
+    params = [NECHAD2016[product] for product in products]
+    rhos = ee.Image.cat([image.select(band).rename(name) for band, _, _, name in params])
+    A = ee.Image.constant([a for _, a, _, _ in params])
+    C = ee.Image.constant([c for _, _, c, _ in params])
+
+    return rhos.multiply(A).divide(ee.Image(1).subtract(rhos.divide(C))).toFloat()
+
 def spm_nechad2016_665(image : ee.Image) -> ee.Image:
     """
     Compute suspended particulate matter using Nechad et al. (2016) algorithm at 665nm.
@@ -120,9 +175,7 @@ def spm_nechad2016_665(image : ee.Image) -> ee.Image:
     algorithm for mapping of total suspended matter in turbid waters.
     Remote Sensing of Environment, 159, 139-152.
     """
-    return image.expression('(A * red) / (1 - (red / C))', {'A' : 342.10,
-                                                            'C' : 0.19563, 
-                                                            'red' : image.select('rhos_B4') }).rename('SPM_Nechad2016_665').toFloat()
+    return nechad2016(image, ['spm_nechad2016'])
 
 def spm_nechad2016_704(image : ee.Image) -> ee.Image:
     """
@@ -138,9 +191,7 @@ def spm_nechad2016_704(image : ee.Image) -> ee.Image:
     ee.Image
         SPM concentration in mg/L.
     """
-    return image.expression('(A * red) / (1 - (red / C))', {'A' : 444.36,
-                                                            'C' : 0.18753, 
-                                                            'red' : image.select('rhos_B5') }).rename('SPM_Nechad2016_704').toFloat()
+    return nechad2016(image, ['spm_nechad2016_704'])
 
 def spm_nechad2016_740(image : ee.Image) -> ee.Image:
     """
@@ -156,9 +207,7 @@ def spm_nechad2016_740(image : ee.Image) -> ee.Image:
     ee.Image
         SPM concentration in mg/L.
     """
-    return image.expression('(A * red) / (1 - (red / C))', {'A' : 1517.00,
-                                                            'C' : 0.19736, 
-                                                            'red' : image.select('rhos_B6') }).rename('SPM_Nechad2016_739').toFloat()
+    return nechad2016(image, ['spm_nechad2016_740'])
 
 def tur_nechad2016_665(image : ee.Image) -> ee.Image:
     """
@@ -174,9 +223,7 @@ def tur_nechad2016_665(image : ee.Image) -> ee.Image:
     ee.Image
         Turbidity in FNU (Formazin Nephelometric Units).
     """
-    return image.expression('(A * red) / (1 - (red / C))', {'A' : 366.14,
-                                                            'C' : 0.19563, 
-                                                            'red' : image.select('rhos_B4') }).rename('TUR_Nechad2016_665').toFloat()
+    return nechad2016(image, ['tur_nechad2016'])
 
 def tur_nechad2016_704(image : ee.Image) -> ee.Image:
     """
@@ -192,9 +239,7 @@ def tur_nechad2016_704(image : ee.Image) -> ee.Image:
     ee.Image
         Turbidity in FNU (Formazin Nephelometric Units).
     """
-    return image.expression('(A * red) / (1 - (red / C))', {'A' : 439.09,
-                                                            'C' : 0.18753, 
-                                                            'red' : image.select('rhos_B5') }).rename('TUR_Nechad2016_704').toFloat()
+    return nechad2016(image, ['tur_nechad2016_704'])
 
 def tur_nechad2016_740(image : ee.Image) -> ee.Image:
     """
@@ -210,9 +255,33 @@ def tur_nechad2016_740(image : ee.Image) -> ee.Image:
     ee.Image
         Turbidity in FNU (Formazin Nephelometric Units).
     """
-    return image.expression('(A * red) / (1 - (red / C))', {'A' : 1590.66,
-                                                            'C' : 0.19736, 
-                                                            'red' : image.select('rhos_B6') }).rename('TUR_Nechad2016_739').toFloat()
+    return nechad2016(image, ['tur_nechad2016_740'])
+
+def _ocx(x : ee.Image, coefficients : tuple) -> ee.Image:
+    """
+    Evaluate the OCx polynomial ``10 ** (A + B*x + C*x² + D*x³ + E*x⁴)``.
+
+    Uses Horner's scheme so each power of ``x`` is not recomputed.
+
+    Parameters
+    ----------
+    x : ee.Image
+        Log band ratio.
+    coefficients : tuple of float
+        Polynomial coefficients (A, B, C, D, E), lowest order first.
+
+    Returns
+    -------
+    ee.Image
+        Chlorophyll-a concentration in mg/m³.
+    """
+    *lower, highest = coefficients
+    polynomial = ee.Image.constant(highest)
+    for coefficient in reversed(lower):
+        polynomial = polynomial.multiply(x).add(coefficient)
+
+    # 10 ** p == exp(p * ln 10): native exp instead of a constant-image pow
+    return polynomial.multiply(_LN10).exp()
 
 def chl_oc2(image : ee.Image) -> ee.Image:
     """
@@ -234,15 +303,8 @@ def chl_oc2(image : ee.Image) -> ee.Image:
     -----
     TODO: Interpolate B1 to B2 dimensions for improved accuracy.
     """
-    A, B, C, D, E = 0.1977,-1.8117,1.9743,-2.5635,-0.7218
-    x = image.expression('log( x / y )', {'x' : image.select('rhos_B2'), 
-                                          'y' : image.select('rhos_B3') }).rename('x')
-    return image.expression('10 ** (A + B * x + C * (x**2) + D * (x**3) + E * (x**4) )', {'A' : A, 
-                                                                                          'B' : B, 
-                                                                                          'C' : C, 
-                                                                                          'D' : D,
-                                                                                          'E' : E,
-                                                                                          'x' : x }).rename('chl_oc2').toFloat()
+    x = image.select('rhos_B2').divide(image.select('rhos_B3')).log()
+    return _ocx(x, (0.1977,-1.8117,1.9743,-2.5635,-0.7218)).rename('chl_oc2').toFloat()
 
 def chl_oc3(image : ee.Image) -> ee.Image:
     """
@@ -266,15 +328,8 @@ def chl_oc3(image : ee.Image) -> ee.Image:
     -----
     TODO: Interpolate B1 to B2 dimensions for improved accuracy.
     """
-    A, B, C, D, E = 0.2412,-2.0546,1.1776,-0.5538,-0.4570
-    x = image.expression('log( x / y )', {'x' : image.select('rhos_B2').max(image.select('rhos_B1')).rename('x'), 
-                                          'y' : image.select('rhos_B3') }).rename('x')
-    return image.expression('10 ** (A + B * x + C * (x**2) + D * (x**3) + E * (x**4) )', {'A' : A, 
-                                                                                          'B' : B, 
-                                                                                          'C' : C, 
-                                                                                          'D' : D,
-                                                                                          'E' : E,
-                                                                                          'x' : x }).rename('chl_oc3').toFloat()
+    x = image.select('rhos_B2').max(image.select('rhos_B1')).divide(image.select('rhos_B3')).log()
+    return _ocx(x, (0.2412,-2.0546,1.1776,-0.5538,-0.4570)).rename('chl_oc3').toFloat()
 
 def chl_re_mishra(image : ee.Image) -> ee.Image:
     """
@@ -301,11 +356,8 @@ def chl_re_mishra(image : ee.Image) -> ee.Image:
     turbid productive waters. Remote Sensing of Environment, 117, 394-406.
     """
     a, b, c = 14.039, 86.11, 194.325
-    ndci = image.normalizedDifference(['rhos_B5', 'rhos_B4']).rename('ndci')
-    return image.expression('a + b * ndci + c * ndci * ndci', {'a' : a, 
-                                                               'b' : b, 
-                                                               'c' : c, 
-                                                               'ndci' : ndci }).rename('chl_re_mishra').toFloat()
+    ndci = image.normalizedDifference(['rhos_B5', 'rhos_B4'])
+    return ndci.multiply(c).add(b).multiply(ndci).add(a).rename('chl_re_mishra').toFloat()
 
 def ndwi(image : ee.Image) -> ee.Image:
     """
@@ -355,13 +407,7 @@ def pSDB_red(image : ee.Image, median_radius: int = 1) -> ee.Image:
     Estuarine, Coastal and Shelf Science, 226, 106277.
     https://doi.org/10.1016/j.ecss.2019.106277
     """
-    kernel = ee.Kernel.circle(radius=median_radius)
-    blue  = image.select('Rrs_B2').focal_median(kernel=kernel)
-    red   = image.select('Rrs_B4').focal_median(kernel=kernel)
-    return image.expression('log(n * pi * blue) / log(n * pi * red)', {'n' : 1_000,
-                                                                       'pi' : float(np.pi),
-                                                                       'blue' : blue,
-                                                                       'red' : red }).rename('pSDB_red').toFloat()
+    return psdb(image, ['pSDB_red'], median_radius=median_radius)
 
 def pSDB_green(image : ee.Image, median_radius: int = 1) -> ee.Image:
     """
@@ -394,15 +440,40 @@ def pSDB_green(image : ee.Image, median_radius: int = 1) -> ee.Image:
     Estuarine, Coastal and Shelf Science, 226, 106277.
     https://doi.org/10.1016/j.ecss.2019.106277
     """
+    return psdb(image, ['pSDB_green'], median_radius=median_radius)
+
+def psdb(image : ee.Image, products : list, median_radius: int = 1) -> ee.Image:
+    """
+    Compute several pseudo-Satellite Derived Bathymetry ratios at once.
+
+    The blue band is median filtered and log-transformed once and shared
+    by every requested ratio (see ``pSDB_red`` and ``pSDB_green``).
+
+    Parameters
+    ----------
+    image : ee.Image
+        Image with remote sensing reflectance bands 'Rrs_B2' and the
+        denominator bands of the requested products.
+    products : list of str
+        Product keys from ``PSDB_BANDS`` (e.g., ['pSDB_red', 'pSDB_green']).
+    median_radius : int, optional
+        Radius in pixels for the circular median kernel (default: 1 → 3×3).
+
+    Returns
+    -------
+    ee.Image
+        One band per product, with the same names as the single-product functions.
+    """
     kernel = ee.Kernel.circle(radius=median_radius)
-    blue  = image.select('Rrs_B2').focal_median(kernel=kernel)
-    green = image.select('Rrs_B3').focal_median(kernel=kernel)
-    return image.expression('log(n * pi * blue) / log(n * pi * green)', {'n' : 1_000,
-                                                                         'pi' : float(np.pi),
-                                                                         'blue' : blue,
-                                                                         'green' : green }).rename('pSDB_green').toFloat()
+    bands = list(dict.fromkeys(['Rrs_B2', *[PSDB_BANDS[product] for product in products]]))
+    # log(n * pi * x) = log(x) + log(n * pi), with n = 1000
+    log_rrs = image.select(bands).focal_median(kernel=kernel).rename(bands).log().add(_LOG_1000_PI)
+    log_blue = log_rrs.select('Rrs_B2')
+
+    return ee.Image.cat([log_blue.divide(log_rrs.select(PSDB_BANDS[product])).rename(product) 
+                         for product in products]).toFloat()
 
-def rrs(image : ee.Image) -> ee.image:
+def rrs(image : ee.Image) -> ee.Image:
     """
     Convert surface reflectance to remote sensing reflectance.
     
@@ -416,11 +487,26 @@ def rrs(image : ee.Image) -> ee.image:
     
     Returns
     -------
-    list of ee.Image
-        List of Rrs bands for all Sentinel-2 bands.
+    ee.Image
+        Rrs bands (Rrs_B*) for all Sentinel-2 bands.
     """
-    bands = ['B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A', 'B9', 'B10', 'B11', 'B12']
-    return [ image.select(f'rhos_{band}').divide(np.pi).rename(f'Rrs_{band}').toFloat() for band in bands ]
+    return image.select([f'rhos_{band}' for band in SENTINEL2_BANDS]).divide(_PI).rename([f'Rrs_{band}' for band in SENTINEL2_BANDS]).toFloat()
+
+# Nechad et al. (2016) coefficients: (band, A, C, output band name)
+NECHAD2016 = {
+    'spm_nechad2016' : ('rhos_B4', 342.10, 0.19563, 'SPM_Nechad2016_665'),
+    'spm_nechad2016_704' : ('rhos_B5', 444.36, 0.18753, 'SPM_Nechad2016_704'),
+    'spm_nechad2016_740' : ('rhos_B6', 1517.00, 0.19736, 'SPM_Nechad2016_739'),
+    'tur_nechad2016' : ('rhos_B4', 366.14, 0.19563, 'TUR_Nechad2016_665'),
+    'tur_nechad2016_704' : ('rhos_B5', 439.09, 0.18753, 'TUR_Nechad2016_704'),
+    'tur_nechad2016_740' : ('rhos_B6', 1590.66, 0.19736, 'TUR_Nechad2016_739'),
+}
+
+# pSDB products: denominator band of the log-ratio against 'Rrs_B2'
+PSDB_BANDS = {
+    'pSDB_red' : 'Rrs_B4',
+    'pSDB_green' : 'Rrs_B3',
+}
 
 # Dictionary mapping product names to computation functions
 PRODUCTS = {